@@ -1,13 +1,16 @@
 """Main Pydantic AI agent for MeshBot."""
 
 import asyncio
+import functools
 import logging
+import textwrap
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError, UsageLimitExceeded
 
 from .memory import MemoryManager
 from .meshcore_interface import (
@@ -42,6 +45,54 @@ class AgentResponse(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=128)
+def split_message(message: str, max_length: int) -> tuple[str, ...]:
+    """
+    Split a message into chunks of at most max_length characters.
+
+    Pure and cached: tool replies (weather, help, status) often repeat
+    verbatim, so identical responses skip the split entirely.
+
+    Args:
+        message: The message to split
+        max_length: Maximum length of each chunk, including the (X/Y) suffix
+
+    Returns:
+        Tuple of message chunks
+    """
+    # Normalize whitespace but preserve intentional newlines for formatting
+    # Replace multiple newlines with single ones, and clean up extra spaces
+    lines = message.strip().split("\n")
+    cleaned_lines = [" ".join(line.split()) for line in lines]
+    message = "\n".join(cleaned_lines)
+
+    # If message fits, return as-is
+    if len(message) <= max_length:
+        return (message,)
+
+    # Calculate how much space we need for " (X/Y)" suffix
+    # Worst case: " (99/99)" = 8 chars
+    suffix_space = 8
+    # Single greedy pass on word boundaries; words longer than a whole
+    # chunk are broken so no chunk can exceed max_length
+    # Newlines only survive in a single message; collapse all whitespace
+    # runs (including paragraph breaks) so chunks never carry double spaces
+    # (at least one character wide, so tiny limits degrade instead of raising)
+    chunks = textwrap.wrap(
+        " ".join(message.split()),
+        max(1, max_length - suffix_space),
+        break_long_words=True,
+        break_on_hyphens=False,
+    )
+
+    # Add (X/Y) indicators (needs the total, so chunks are materialized here)
+    total = len(chunks)
+    if total > 1:
+        return tuple(f"{chunk} ({i+1}/{total})" for i, chunk in enumerate(chunks))
+
+    return tuple(chunks)
+
+
 class MeshBotAgent:
     """Main AI agent for MeshBot."""
 
@@ -80,6 +131,9 @@ class MeshBotAgent:
         self._agent: Optional[Agent[MeshBotDependencies, AgentResponse]] = None
         self._own_public_key: Optional[str] = None
 
+        # Fire-and-forget sends (strong refs keep them alive until done)
+        self._background_tasks: set[asyncio.Task[None]] = set()
+
         self._running = False
 
     @property
@@ -140,8 +194,10 @@ class MeshBotAgent:
                     f"System prompt file not found: {self.system_prompt_file}"
                 )
 
-            with open(self.system_prompt_file, "r", encoding="utf-8") as f:
-                instructions = f.read()
+            # Read in a worker thread; initialize() runs on the event loop
+            instructions = await asyncio.to_thread(
+                self.system_prompt_file.read_text, encoding="utf-8"
+            )
             logger.info(f"Loaded system prompt from: {self.system_prompt_file}")
         except Exception as e:
             logger.error(f"Error loading system prompt: {e}")
@@ -251,6 +307,9 @@ class MeshBotAgent:
 
         self._running = False
 
+        # Let pending notices finish before the connection goes away
+        await self.drain()
+
         # Save memory
         if self.memory:
             await self.memory.save()
@@ -261,6 +320,11 @@ class MeshBotAgent:
 
         logger.info("MeshBot agent stopped")
 
+    async def drain(self) -> None:
+        """Wait for outstanding background sends to finish."""
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
     def _split_message(self, message: str) -> List[str]:
         """
         Split a long message into chunks that fit within max_message_length.
@@ -272,50 +336,7 @@ class MeshBotAgent:
         Returns:
             List of message chunks
         """
-        # Normalize whitespace but preserve intentional newlines for formatting
-        # Replace multiple newlines with single ones, and clean up extra spaces
-        lines = message.strip().split("\n")
-        cleaned_lines = [" ".join(line.split()) for line in lines]
-        message = "\n".join(cleaned_lines)
-
-        # If message fits, return as-is
-        if len(message) <= self.max_message_length:
-            return [message]
-
-        # Calculate how much space we need for " (X/Y)" suffix
-        # Worst case: " (99/99)" = 8 chars
-        suffix_space = 8
-        chunk_size = self.max_message_length - suffix_space
-
-        # Split into chunks on word boundaries
-        words = message.split()
-        chunks = []
-        current_chunk: list[str] = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word) + (1 if current_chunk else 0)  # +1 for space
-
-            if current_length + word_length <= chunk_size:
-                current_chunk.append(word)
-                current_length += word_length
-            else:
-                # Save current chunk and start new one
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
-
-        # Add the last chunk
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        # Add (X/Y) indicators
-        total = len(chunks)
-        if total > 1:
-            chunks = [f"{chunk} ({i+1}/{total})" for i, chunk in enumerate(chunks)]
-
-        return chunks
+        return list(split_message(message, self.max_message_length))
 
     def _should_respond_to_message(self, message: MeshCoreMessage) -> bool:
         """
@@ -415,11 +436,11 @@ class MeshBotAgent:
         """
         try:
             logger.info("=== MESSAGE RECEIVED ===")
-            logger.info(f"From: {message.sender}")
-            logger.info(f"Content: '{message.content}'")
-            logger.info(f"Type: {message.message_type}")
-            logger.info(f"Channel: {getattr(message, 'channel', None)}")
-            logger.info(f"Timestamp: {message.timestamp}")
+            logger.info("From: %s", message.sender)
+            logger.info("Content: '%s'", message.content)
+            logger.info("Type: %s", message.message_type)
+            logger.info("Channel: %s", getattr(message, "channel", None))
+            logger.info("Timestamp: %s", message.timestamp)
 
             # Check if we should respond to this message
             should_respond = self._should_respond_to_message(message)
@@ -427,6 +448,10 @@ class MeshBotAgent:
                 logger.info("Message filtered out, not responding")
                 return True  # Not an error, just filtered out
 
+            # Resolve the initialized components once for the whole handler
+            meshcore = self.meshcore
+            memory = self.memory
+
             # Determine conversation identifier
             # For channels: use channel as identifier
             # For DMs: use sender as identifier
@@ -436,7 +461,7 @@ class MeshBotAgent:
                 conversation_id = message.sender
 
             # Store user message in memory
-            await self.memory.add_message(
+            await memory.add_message(
                 user_id=conversation_id,
                 role="user",
                 content=message.content,
@@ -445,12 +470,12 @@ class MeshBotAgent:
             )
 
             # Get conversation context
-            context = await self.memory.get_conversation_context(
+            context = await memory.get_conversation_context(
                 user_id=conversation_id, message_type=message.message_type
             )
 
             # Create dependencies for this interaction
-            deps = MeshBotDependencies(meshcore=self.meshcore, memory=self.memory)
+            deps = MeshBotDependencies(meshcore=meshcore, memory=memory)
 
             # Build the prompt with conversation history
             # Emphasize the current user message and reduce network event prominence
@@ -483,8 +508,8 @@ class MeshBotAgent:
 
             # Log the full prompt being sent to LLM
             logger.info("=== SENDING PROMPT TO LLM ===")
-            logger.info(f"Prompt: {prompt}")
-            logger.info(f"Context length: {len(prompt)} characters")
+            logger.info("Prompt: %s", prompt)
+            logger.info("Context length: %d characters", len(prompt))
             logger.info("=== END PROMPT ===")
 
             try:
@@ -493,15 +518,15 @@ class MeshBotAgent:
                 )
                 logger.info("✅ LLM run completed successfully")
             except Exception as e:
-                logger.error(f"❌ LLM run failed: {e}")
+                logger.error("❌ LLM run failed: %s", e)
                 raise
 
             # Send response
             response = result.output.response
             logger.info("=== LLM RESPONSE ===")
-            logger.info(f"Raw response: {result}")
-            logger.info(f"Response text: {response}")
-            logger.info(f"Confidence: {result.output.confidence}")
+            logger.info("Raw response: %s", result)
+            logger.info("Response text: %s", response)
+            logger.info("Confidence: %s", result.output.confidence)
             logger.info("=== END LLM RESPONSE ===")
 
             if response:
@@ -517,13 +542,15 @@ class MeshBotAgent:
                 message_chunks = self._split_message(response)
 
                 logger.info(
-                    f"Sending {len(message_chunks)} message(s) to {destination}"
+                    "Sending %d message(s) to %s", len(message_chunks), destination
                 )
-                logger.info(f"Message chunks: {message_chunks}")
+                logger.info("Message chunks: %s", message_chunks)
 
                 # Send all chunks with retry logic
                 for i, chunk in enumerate(message_chunks):
-                    logger.info(f"Sending chunk {i+1}/{len(message_chunks)}: {chunk}")
+                    logger.info(
+                        "Sending chunk %d/%d: %s", i + 1, len(message_chunks), chunk
+                    )
 
                     # Try sending with retries
                     success = False
@@ -531,30 +558,45 @@ class MeshBotAgent:
                         if attempt > 0:
                             retry_delay = 2.0 ** attempt  # Exponential backoff: 2s, 4s, 8s...
                             logger.warning(
-                                f"Retry attempt {attempt}/{self.message_retry_count} after {retry_delay}s delay"
+                                "Retry attempt %d/%d after %ss delay",
+                                attempt,
+                                self.message_retry_count,
+                                retry_delay,
                             )
                             await asyncio.sleep(retry_delay)
 
-                        success = await self.meshcore.send_message(destination, chunk)
+                        success = await meshcore.send_message(destination, chunk)
 
                         if success:
-                            logger.debug(f"Chunk {i+1}/{len(message_chunks)} sent successfully")
+                            logger.debug(
+                                "Chunk %d/%d sent successfully",
+                                i + 1,
+                                len(message_chunks),
+                            )
                             break
                         else:
                             logger.warning(
-                                f"Failed to send chunk {i+1}/{len(message_chunks)} (attempt {attempt+1}/{self.message_retry_count+1})"
+                                "Failed to send chunk %d/%d (attempt %d/%d)",
+                                i + 1,
+                                len(message_chunks),
+                                attempt + 1,
+                                self.message_retry_count + 1,
                             )
 
                     if not success:
                         logger.error(
-                            f"Failed to send chunk {i+1}/{len(message_chunks)} after {self.message_retry_count+1} attempts"
+                            "Failed to send chunk %d/%d after %d attempts",
+                            i + 1,
+                            len(message_chunks),
+                            self.message_retry_count + 1,
                         )
                         # Continue trying to send remaining chunks even if one fails
 
                     # Delay between messages to respect LoRa duty cycle
                     if i < len(message_chunks) - 1:
                         logger.debug(
-                            f"Waiting {self.message_delay}s before next chunk (LoRa duty cycle)"
+                            "Waiting %ss before next chunk (LoRa duty cycle)",
+                            self.message_delay,
                         )
                         await asyncio.sleep(self.message_delay)
 
@@ -563,7 +605,7 @@ class MeshBotAgent:
                 user_id = (
                     destination if message.message_type == "channel" else message.sender
                 )
-                await self.memory.add_message(
+                await memory.add_message(
                     user_id=user_id,
                     role="assistant",
                     content=response,
@@ -580,46 +622,41 @@ class MeshBotAgent:
             return True
 
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Error handling message: {error_msg}")
+            logger.error("Error handling message: %s", e)
 
             # Check for usage limit exceeded
-            if "request_limit" in error_msg or "UsageLimit" in error_msg:
+            if isinstance(e, UsageLimitExceeded):
                 logger.warning(
                     "API request limit reached - query too complex, simplifying response"
                 )
-                # Send a helpful message to the user
-                try:
-                    await self.meshcore.send_message(
-                        message.sender,
-                        "Sorry, that query is too complex. Please try a simpler question or break it into smaller parts.",
-                    )
-                    return True  # Handled gracefully
-                except Exception:
-                    pass
+                # Send a helpful message to the user without waiting on the radio
+                self._notify_in_background(
+                    message.sender,
+                    "Sorry, that query is too complex. Please try a simpler question or break it into smaller parts.",
+                )
+                return True  # Handled gracefully
 
             # Check for common API errors and provide helpful messages
-            if "status_code: 403" in error_msg or "Access denied" in error_msg:
-                logger.error(
-                    "API Access Denied - Check your API key and account status"
-                )
-                logger.error(
-                    "Make sure LLM_API_KEY is valid and has sufficient credits"
-                )
-            elif "status_code: 401" in error_msg or "Unauthorized" in error_msg:
-                logger.error("API Unauthorized - Check your LLM_API_KEY")
-            elif "status_code: 429" in error_msg or "rate_limit" in error_msg:
-                logger.error("API Rate Limit - Too many requests")
+            if isinstance(e, ModelHTTPError):
+                match e.status_code:
+                    case 403:
+                        logger.error(
+                            "API Access Denied - Check your API key and account status"
+                        )
+                        logger.error(
+                            "Make sure LLM_API_KEY is valid and has sufficient credits"
+                        )
+                    case 401:
+                        logger.error("API Unauthorized - Check your LLM_API_KEY")
+                    case 429:
+                        logger.error("API Rate Limit - Too many requests")
 
             # Send error response (in production mode)
             if not raise_errors:
-                try:
-                    await self.meshcore.send_message(
-                        message.sender,
-                        "Sorry, I encountered an error processing your message.",
-                    )
-                except Exception:
-                    pass
+                self._notify_in_background(
+                    message.sender,
+                    "Sorry, I encountered an error processing your message.",
+                )
 
             # Re-raise in test mode
             if raise_errors:
@@ -627,6 +664,24 @@ class MeshBotAgent:
 
             return False
 
+    def _notify_in_background(self, destination: str, text: str) -> None:
+        """
+        Send a best-effort notice without blocking the message handler.
+
+        A wedged radio can hold a send for the full MeshCore timeout, so
+        error notices are dispatched as tasks and the handler returns at once.
+        """
+        task = asyncio.create_task(self._safe_notify(destination, text))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _safe_notify(self, destination: str, text: str) -> None:
+        """Send a notice, logging instead of raising on failure."""
+        try:
+            await self.meshcore.send_message(destination, text)
+        except Exception as e:
+            logger.warning("Could not send notice to %s: %s", destination, e)
+
     async def _handle_action(
         self, action: str, action_data: Optional[Dict[str, Any]], sender: str
     ) -> None:
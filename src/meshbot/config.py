@@ -10,8 +10,11 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Model providers that need LLM_API_KEY (the agent exports it as OPENAI_API_KEY)
+_KEY_REQUIRED_PROVIDERS = frozenset({"openai", "openai-chat", "openai-responses"})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MeshCoreConfig:
     """Configuration for MeshCore connection."""
 
@@ -50,7 +53,7 @@ class MeshCoreConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AIConfig:
     """Configuration for AI model and LLM API."""
 
@@ -68,29 +71,29 @@ class AIConfig:
     max_message_length: int = field(
         default_factory=lambda: int(os.getenv("LLM_MAX_MESSAGE_LENGTH", "120"))
     )
-    system_prompt_file: Optional[Path] = field(default=None)
-
-    def __post_init__(self) -> None:
-        """Post-initialization to handle system prompt file."""
-        # Handle system prompt file
-        system_prompt_env = os.getenv("LLM_PROMPT_FILE")
-        if system_prompt_env and not self.system_prompt_file:
-            self.system_prompt_file = Path(system_prompt_env)
-        elif not self.system_prompt_file:
-            # Default to prompts/default.md
-            self.system_prompt_file = Path("prompts/default.md")
+    system_prompt_file: Optional[Path] = field(
+        default_factory=lambda: Path(
+            os.getenv("LLM_PROMPT_FILE") or "prompts/default.md"
+        )
+    )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemoryConfig:
     """Configuration for data storage."""
 
     storage_path: Path = field(
         default_factory=lambda: Path(os.getenv("DATA_DIR", "./data"))
     )
+    max_messages_per_user: int = field(
+        default_factory=lambda: int(os.getenv("MEMORY_MAX_MESSAGES", "100"))
+    )
+    cleanup_days: int = field(
+        default_factory=lambda: int(os.getenv("MEMORY_CLEANUP_DAYS", "30"))
+    )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeatherConfig:
     """Configuration for weather service."""
 
@@ -107,15 +110,9 @@ class WeatherConfig:
     forecast_days: int = field(
         default_factory=lambda: int(os.getenv("WEATHER_FORECAST_DAYS", "3"))
     )
-    max_messages_per_user: int = field(
-        default_factory=lambda: int(os.getenv("MEMORY_MAX_MESSAGES", "100"))
-    )
-    cleanup_days: int = field(
-        default_factory=lambda: int(os.getenv("MEMORY_CLEANUP_DAYS", "30"))
-    )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Configuration for logging."""
 
@@ -128,7 +125,7 @@ class LoggingConfig:
     file_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MeshBotConfig:
     """Main configuration for MeshBot."""
 
@@ -148,11 +145,12 @@ class MeshBotConfig:
 
         # Validate AI config - check if API key is needed
         # Most models require an API key unless using local Ollama without auth
-        if self.ai.model.startswith("openai") and not self.ai.api_key:
-            if not os.getenv("LLM_API_KEY"):
-                raise ValueError(
-                    "LLM API key required. Set LLM_API_KEY environment variable"
-                )
+        # (api_key already defaults to LLM_API_KEY, so no second env lookup)
+        provider = self.ai.model.split(":", 1)[0]
+        if provider in _KEY_REQUIRED_PROVIDERS and not self.ai.api_key:
+            raise ValueError(
+                "LLM API key required. Set LLM_API_KEY environment variable"
+            )
 
         # Validate paths
         self.memory.storage_path.parent.mkdir(parents=True, exist_ok=True)
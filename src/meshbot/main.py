@@ -1,46 +1,132 @@
 """Main entry point for MeshBot."""
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import signal
 import sys
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import click
 
-from .agent import MeshBotAgent
-from .config import load_config
+from .config import MeshBotConfig, load_config
+
+if TYPE_CHECKING:
+    from .agent import MeshBotAgent
+
+T = TypeVar("T")
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush and stop the logging listener thread."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+# Custom level below DEBUG for very chatty output (-vv)
+TRACE = 5
+
+_LEVELS: Dict[str, int] = {
+    "TRACE": TRACE,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+_CONSOLE_FORMATTER = logging.Formatter("%(levelname)s: %(message)s")
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop when installed, else the stock loop."""
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+    # Run new tasks eagerly up to their first await instead of next iteration
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a fresh loop from _new_event_loop."""
+    return asyncio.run(main, loop_factory=_new_event_loop)
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[Path] = None) -> None:
     """Setup logging configuration."""
     # Add custom TRACE level if not already defined
     if not hasattr(logging, "TRACE"):
-        logging.TRACE = 5  # type: ignore[attr-defined]
-        logging.addLevelName(logging.TRACE, "TRACE")  # type: ignore[attr-defined]
+        logging.TRACE = TRACE  # type: ignore[attr-defined]
+        logging.addLevelName(TRACE, "TRACE")
 
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    log_level = _LEVELS.get(level.upper(), logging.INFO)
 
     # Configure basic logging
     handlers: list[logging.Handler] = []
 
     # Console handler with simple format
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     handlers.append(console_handler)
 
     # File handler if configured
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        # Batch writes; errors (and shutdown) flush immediately
+        handlers.append(
+            logging.handlers.MemoryHandler(
+                capacity=256,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True,
+            )
         )
-        handlers.append(file_handler)
 
-    # Configure root logger
+    # Hand records to a listener thread so the event loop never blocks on I/O
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    # Configure root logger; the queue carries the bare message and the
+    # listener's handlers apply the real formats
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        format="%(message)s",
+        handlers=[queue_handler],
         force=True,
     )
 
@@ -51,6 +137,112 @@ def cli() -> None:
     pass
 
 
+# Log level by -v count (none, -v, -vv and beyond)
+_VERBOSITY_LEVELS = ("INFO", "DEBUG", "TRACE")
+
+# CLI option -> (config section, field, none_is_unset). Options are unset when
+# falsy, except --x/--no-x switches: they default to None so that an explicit
+# False still overrides the environment.
+_CLI_OVERRIDES: Dict[str, Tuple[str, str, bool]] = {
+    "model": ("ai", "model", False),
+    "llm_prompt": ("ai", "system_prompt_file", False),
+    "max_message_length": ("ai", "max_message_length", False),
+    "listen_channel": ("meshcore", "listen_channel", False),
+    "meshcore_connection_type": ("meshcore", "connection_type", False),
+    "meshcore_node_name": ("meshcore", "node_name", False),
+    "meshcore_port": ("meshcore", "port", False),
+    "meshcore_host": ("meshcore", "host", False),
+    "meshcore_address": ("meshcore", "address", False),
+    "meshcore_baudrate": ("meshcore", "baudrate", False),
+    "meshcore_debug": ("meshcore", "debug", False),
+    "meshcore_auto_reconnect": ("meshcore", "auto_reconnect", True),
+    "meshcore_timeout": ("meshcore", "timeout", False),
+    "data_dir": ("memory", "storage_path", False),
+}
+
+
+def _prepare(
+    verbose: int,
+    options: Dict[str, Any],
+    log_file: Optional[Path] = None,
+    require_api_key: bool = False,
+) -> MeshBotConfig:
+    """Set up logging and build the effective configuration for a command.
+
+    Args:
+        verbose: Number of -v flags given
+        options: Parameters of the invoking click command
+        log_file: Optional log file path
+        require_api_key: Exit with setup guidance if LLM_API_KEY is not set
+
+    Returns:
+        Environment configuration with command line overrides applied
+    """
+    level = _VERBOSITY_LEVELS[min(verbose, 2)]
+    setup_logging(level, log_file)
+    logger = logging.getLogger(__name__)
+
+    # Checked before load_config(), whose validation would otherwise reject
+    # a missing key with a terser error first
+    if require_api_key and not os.getenv("LLM_API_KEY"):
+        logger.error("LLM_API_KEY environment variable not set!")
+        logger.info("Please set your LLM API key:")
+        logger.info("  export LLM_API_KEY='your-api-key-here'")
+        logger.info("Or create a .env file with:")
+        logger.info("  LLM_API_KEY=your-api-key-here")
+        sys.exit(1)
+
+    try:
+        app_config = load_config()
+
+        # Override with command line arguments (highest priority)
+        overrides: Dict[str, Dict[str, Any]] = {"ai": {}, "meshcore": {}, "memory": {}}
+        for option, (section, field_name, none_is_unset) in _CLI_OVERRIDES.items():
+            value = options.get(option)
+            unset = value is None if none_is_unset else not value
+            if not unset:
+                overrides[section][field_name] = value
+
+        # Config sections are frozen, so overrides replace them wholesale
+        return replace(
+            app_config,
+            ai=replace(app_config.ai, **overrides["ai"]),
+            meshcore=replace(app_config.meshcore, **overrides["meshcore"]),
+            memory=replace(app_config.memory, **overrides["memory"]),
+            logging=replace(app_config.logging, level=level),
+        )
+
+    except Exception as e:
+        logger.error("Error loading configuration: %s", e)
+        sys.exit(1)
+
+
+def _create_agent(app_config: MeshBotConfig) -> "MeshBotAgent":
+    """Construct a MeshBotAgent from the effective configuration."""
+    # Deferred so --help doesn't pay for pydantic-ai and the MeshCore stack
+    from .agent import MeshBotAgent
+
+    return MeshBotAgent(
+        model=app_config.ai.model,
+        data_dir=app_config.memory.storage_path,
+        meshcore_connection_type=app_config.meshcore.connection_type,
+        listen_channel=app_config.meshcore.listen_channel,
+        system_prompt_file=app_config.ai.system_prompt_file,
+        max_message_length=app_config.ai.max_message_length,
+        base_url=app_config.ai.base_url,
+        node_name=app_config.meshcore.node_name,
+        message_delay=app_config.meshcore.message_delay,
+        message_retry_count=app_config.meshcore.message_retry_count,
+        port=app_config.meshcore.port,
+        baudrate=app_config.meshcore.baudrate,
+        host=app_config.meshcore.host,
+        address=app_config.meshcore.address,
+        debug=app_config.meshcore.debug,
+        auto_reconnect=app_config.meshcore.auto_reconnect,
+        timeout=app_config.meshcore.timeout,
+    )
+
+
 @cli.command()
 @click.option("--model", "-m", help="AI model to use (e.g., openai:gpt-4o-mini)")
 @click.option(
@@ -87,113 +279,25 @@ def cli() -> None:
     help="Increase verbosity (-v for DEBUG, -vv for TRACE)",
 )
 @click.option("--log-file", type=click.Path(path_type=Path), help="Log file path")
-def run(
-    model: Optional[str],
-    llm_prompt: Optional[Path],
-    listen_channel: Optional[str],
-    max_message_length: Optional[int],
-    meshcore_connection_type: Optional[str],
-    meshcore_node_name: Optional[str],
-    meshcore_port: Optional[str],
-    meshcore_host: Optional[str],
-    meshcore_address: Optional[str],
-    meshcore_baudrate: Optional[int],
-    meshcore_debug: bool,
-    meshcore_auto_reconnect: Optional[bool],
-    meshcore_timeout: Optional[int],
-    data_dir: Optional[Path],
-    verbose: int,
-    log_file: Optional[Path],
-) -> None:
+def run(verbose: int, log_file: Optional[Path], **options: Any) -> None:
     """Run the MeshBot agent (daemon mode)."""
-
-    # Determine log level from verbosity
-    if verbose >= 2:
-        level = "TRACE"
-    elif verbose == 1:
-        level = "DEBUG"
-    else:
-        level = "INFO"
-
-    # Setup logging first
-    setup_logging(level, log_file)
+    app_config = _prepare(verbose, options, log_file)
     logger = logging.getLogger(__name__)
 
-    # Load configuration from environment variables
-    try:
-        app_config = load_config()
-
-        # Override with command line arguments (highest priority)
-        # AI configuration
-        if model:
-            app_config.ai.model = model
-        if llm_prompt:
-            app_config.ai.system_prompt_file = llm_prompt
-        if listen_channel:
-            app_config.meshcore.listen_channel = listen_channel
-        if max_message_length:
-            app_config.ai.max_message_length = max_message_length
-
-        # MeshCore configuration
-        if meshcore_connection_type:
-            app_config.meshcore.connection_type = meshcore_connection_type
-        if meshcore_node_name:
-            app_config.meshcore.node_name = meshcore_node_name
-        if meshcore_port:
-            app_config.meshcore.port = meshcore_port
-        if meshcore_host:
-            app_config.meshcore.host = meshcore_host
-        if meshcore_address:
-            app_config.meshcore.address = meshcore_address
-        if meshcore_baudrate:
-            app_config.meshcore.baudrate = meshcore_baudrate
-        if meshcore_debug:
-            app_config.meshcore.debug = meshcore_debug
-        if meshcore_auto_reconnect is not None:
-            app_config.meshcore.auto_reconnect = meshcore_auto_reconnect
-        if meshcore_timeout:
-            app_config.meshcore.timeout = meshcore_timeout
-
-        # Data directory configuration
-        if data_dir:
-            app_config.memory.storage_path = data_dir
-
-    except Exception as e:
-        logger.error(f"Error loading configuration: {e}")
-        sys.exit(1)
-
     # Create and run agent
-    agent = MeshBotAgent(
-        model=app_config.ai.model,
-        data_dir=app_config.memory.storage_path,
-        meshcore_connection_type=app_config.meshcore.connection_type,
-        listen_channel=app_config.meshcore.listen_channel,
-        system_prompt_file=app_config.ai.system_prompt_file,
-        max_message_length=app_config.ai.max_message_length,
-        base_url=app_config.ai.base_url,
-        node_name=app_config.meshcore.node_name,
-        message_delay=app_config.meshcore.message_delay,
-        message_retry_count=app_config.meshcore.message_retry_count,
-        port=app_config.meshcore.port,
-        baudrate=app_config.meshcore.baudrate,
-        host=app_config.meshcore.host,
-        address=app_config.meshcore.address,
-        debug=app_config.meshcore.debug,
-        auto_reconnect=app_config.meshcore.auto_reconnect,
-        timeout=app_config.meshcore.timeout,
-    )
+    agent = _create_agent(app_config)
 
     # Run the agent
     try:
-        asyncio.run(run_agent(agent))
+        run_async(run_agent(agent))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
-        logger.error(f"Error running agent: {e}")
+        logger.error("Error running agent: %s", e)
         sys.exit(1)
 
 
-async def run_agent(agent: MeshBotAgent) -> None:
+async def run_agent(agent: "MeshBotAgent") -> None:
     """Run the agent in daemon mode."""
     logger = logging.getLogger(__name__)
 
@@ -206,19 +310,36 @@ async def run_agent(agent: MeshBotAgent) -> None:
 
         # Show status
         status = await agent.get_status()
-        logger.info(f"Model: {status['model']}")
+        logger.info("Model: %s", status["model"])
         logger.info(
-            f"MeshCore: {status['meshcore_type']} ({'Connected' if status['meshcore_connected'] else 'Disconnected'})"
+            "MeshCore: %s (%s)",
+            status["meshcore_type"],
+            "Connected" if status["meshcore_connected"] else "Disconnected",
         )
         logger.info("Running in daemon mode. Press Ctrl+C to stop.")
 
-        # Run indefinitely
+        # Park until SIGINT/SIGTERM sets the event; no periodic wakeups
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+                handled_signals.append(sig)
+            except NotImplementedError:
+                # Not supported on Windows; Ctrl+C cancels this task instead
+                pass
+
+        # Run until asked to stop
         try:
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
         except asyncio.CancelledError:
             pass
 
+        # Restore default handling so a second Ctrl+C can interrupt shutdown
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+
     finally:
         await agent.stop()
         logger.info("MeshBot stopped")
@@ -262,125 +383,22 @@ async def run_agent(agent: MeshBotAgent) -> None:
     count=True,
     help="Increase verbosity (-v for DEBUG, -vv for TRACE)",
 )
-def test(
-    from_id: str,
-    message: str,
-    model: Optional[str],
-    llm_prompt: Optional[Path],
-    listen_channel: Optional[str],
-    max_message_length: Optional[int],
-    meshcore_connection_type: str,
-    meshcore_node_name: Optional[str],
-    meshcore_port: Optional[str],
-    meshcore_host: Optional[str],
-    meshcore_address: Optional[str],
-    meshcore_baudrate: Optional[int],
-    meshcore_debug: bool,
-    meshcore_auto_reconnect: Optional[bool],
-    meshcore_timeout: Optional[int],
-    data_dir: Optional[Path],
-    verbose: int,
-) -> None:
+def test(from_id: str, message: str, verbose: int, **options: Any) -> None:
     """Send a test message simulating a message from FROM_ID.
 
     FROM_ID: The sender ID to simulate (e.g., 'node1', 'test_user')
     MESSAGE: The message content to send
     """
-
-    # Determine log level from verbosity
-    if verbose >= 2:
-        level = "TRACE"
-    elif verbose == 1:
-        level = "DEBUG"
-    else:
-        level = "INFO"
-
-    # Load configuration from environment variables
-    try:
-        app_config = load_config()
-
-        # Override with command line arguments (highest priority)
-        # AI configuration
-        if model:
-            app_config.ai.model = model
-        if llm_prompt:
-            app_config.ai.system_prompt_file = llm_prompt
-        if listen_channel:
-            app_config.meshcore.listen_channel = listen_channel
-        if max_message_length:
-            app_config.ai.max_message_length = max_message_length
-
-        # MeshCore configuration
-        app_config.meshcore.connection_type = meshcore_connection_type
-        if meshcore_node_name:
-            app_config.meshcore.node_name = meshcore_node_name
-        if meshcore_port:
-            app_config.meshcore.port = meshcore_port
-        if meshcore_host:
-            app_config.meshcore.host = meshcore_host
-        if meshcore_address:
-            app_config.meshcore.address = meshcore_address
-        if meshcore_baudrate:
-            app_config.meshcore.baudrate = meshcore_baudrate
-        if meshcore_debug:
-            app_config.meshcore.debug = meshcore_debug
-        if meshcore_auto_reconnect is not None:
-            app_config.meshcore.auto_reconnect = meshcore_auto_reconnect
-        if meshcore_timeout:
-            app_config.meshcore.timeout = meshcore_timeout
-
-        # Data directory configuration
-        if data_dir:
-            app_config.memory.storage_path = data_dir
-
-        # Logging configuration
-        app_config.logging.level = level
-
-    except Exception as e:
-        logging.error(f"Error loading configuration: {e}")
-        sys.exit(1)
-
-    # Setup logging
-    setup_logging(level)
+    app_config = _prepare(verbose, options, require_api_key=True)
     logger = logging.getLogger(__name__)
 
     # Create and run test
     async def run_test():
         """Run the test message."""
-        import os
-
         from .meshcore_interface import MeshCoreMessage
 
-        # Check if API key is configured
-        api_key = os.getenv("LLM_API_KEY")
-        if not api_key:
-            logger.error("LLM_API_KEY environment variable not set!")
-            logger.info("Please set your LLM API key:")
-            logger.info("  export LLM_API_KEY='your-api-key-here'")
-            logger.info("Or create a .env file with:")
-            logger.info("  LLM_API_KEY=your-api-key-here")
-            sys.exit(1)
-
         # Create agent
-        agent = MeshBotAgent(
-            model=app_config.ai.model,
-            data_dir=app_config.memory.storage_path,
-            meshcore_connection_type=app_config.meshcore.connection_type,
-            listen_channel=app_config.meshcore.listen_channel,
-            system_prompt_file=app_config.ai.system_prompt_file,
-            max_message_length=app_config.ai.max_message_length,
-            base_url=app_config.ai.base_url,
-            node_name=app_config.meshcore.node_name,
-            message_delay=app_config.meshcore.message_delay,
-            message_retry_count=app_config.meshcore.message_retry_count,
-            port=app_config.meshcore.port,
-            baudrate=app_config.meshcore.baudrate,
-            host=app_config.meshcore.host,
-            address=app_config.meshcore.address,
-            debug=app_config.meshcore.debug,
-            auto_reconnect=app_config.meshcore.auto_reconnect,
-            timeout=app_config.meshcore.timeout,
-        )
+        agent = _create_agent(app_config)
 
         try:
             # Initialize and start agent
@@ -388,15 +406,15 @@ def test(
             await agent.start()
 
             logger.info("✓ MeshBot started successfully!")
-            logger.info(f"Simulating message from: {from_id}")
-            logger.info(f"Message: {message}")
+            logger.info("Simulating message from: %s", from_id)
+            logger.info("Message: %s", message)
 
             # Create simulated message
             simulated_message = MeshCoreMessage(
                 sender=from_id,
                 sender_name=from_id,
                 content=message,
-                timestamp=asyncio.get_event_loop().time(),
+                timestamp=time.time(),
                 message_type="direct",
             )
 
@@ -404,19 +422,22 @@ def test(
             logger.info("Processing message (this may take a few seconds)...")
             success = False
             try:
-                success = await asyncio.wait_for(
-                    agent._handle_message(simulated_message, raise_errors=True),
-                    timeout=30.0,  # 30 second timeout
-                )
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(30.0):  # 30 second timeout
+                    # raise_errors keeps the agent from sending an apology
+                    # to the simulated sender over the radio
+                    success = await agent._handle_message(
+                        simulated_message, raise_errors=True
+                    )
+            except TimeoutError:
                 logger.error("Message processing timed out after 30 seconds")
                 logger.warning("This may indicate an API connectivity issue")
-            except Exception:
-                # Error already logged by agent, just note it failed
-                pass
+            except Exception as e:
+                # The agent has already logged the error; keep the traceback
+                # available under -v
+                logger.debug("Message processing failed: %s", e, exc_info=True)
 
-            # Give it a moment for any async operations to complete
-            await asyncio.sleep(0.5)
+            # Wait for any background sends (e.g. usage-limit notices) to complete
+            await agent.drain()
 
             if not success:
                 logger.error("✗ Test failed - see errors above")
@@ -434,17 +455,111 @@ def test(
             await agent.stop()
 
     try:
-        success = asyncio.run(run_test())
+        success = run_async(run_test())
         if not success:
             sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
         sys.exit(130)  # Standard exit code for Ctrl+C
     except Exception as e:
-        logger.error(f"Error running test: {e}")
+        logger.error("Error running test: %s", e)
         sys.exit(1)
 
 
+# time.strftime formats for dump output (no datetime objects per row)
+_DUMP_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+_DUMP_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def _trunc(text: Optional[str], length: int) -> Optional[str]:
+    """Truncate text to length characters, marking the cut with '...'."""
+    if text is None or len(text) <= length:
+        return text
+    return text[:length] + "..."
+
+
+def _fmt_message_row(row: Tuple[Any, ...]) -> str:
+    """Format a messages row for dump output."""
+    timestamp, conversation_id, message_type, role, content = row
+    ts = time.strftime(_DUMP_TS_FORMAT, time.localtime(timestamp))
+    conv_id = _trunc(conversation_id, 16)
+    msg_type = message_type[:3].upper()  # DM/CHA
+    return f"[{ts}] {conv_id} ({msg_type}) {role}: {_trunc(content, 60)}"
+
+
+def _fmt_advert_row(row: Tuple[Any, ...]) -> str:
+    """Format an adverts row for dump output."""
+    timestamp, node_id, node_name, details = row
+    ts = time.strftime(_DUMP_TS_FORMAT, time.localtime(timestamp))
+    node_id = _trunc(node_id, 16) or "unknown"
+    name = f" ({node_name})" if node_name else ""
+    return f"[{ts}] {node_id}{name} {details or ''}"
+
+
+def _fmt_node_row(row: Tuple[Any, ...]) -> str:
+    """Format a nodes row for dump output."""
+    pubkey, name, is_online, first_seen, last_seen, total_adverts = row
+    name = f" ({name})" if name else ""
+    status = "🟢" if is_online else "🔴"
+    first = time.strftime(_DUMP_DATE_FORMAT, time.localtime(first_seen))
+    last = time.strftime(_DUMP_DATE_FORMAT, time.localtime(last_seen))
+    return f"{_trunc(pubkey, 16)}{name} {status} | {first} -> {last} | {total_adverts} adverts"
+
+
+def _fmt_network_event_row(row: Tuple[Any, ...]) -> str:
+    """Format a network_events row for dump output."""
+    timestamp, event_type, details = row
+    ts = time.strftime(_DUMP_TS_FORMAT, time.localtime(timestamp))
+    return f"[{ts}] {event_type}: {details or ''}"
+
+
+def _fmt_node_name_row(row: Tuple[Any, ...]) -> str:
+    """Format a node_names row for dump output."""
+    pubkey, name, timestamp = row
+    ts = time.strftime(_DUMP_TS_FORMAT, time.localtime(timestamp))
+    return f"{_trunc(pubkey, 16)} -> {name} (updated: {ts})"
+
+
+# Table -> (format legend, selected columns, row formatter) for the dump command.
+# Columns are listed explicitly so formatters can unpack plain tuples.
+_DUMP_FORMATS: Dict[str, Tuple[str, str, Callable[[Tuple[Any, ...]], str]]] = {
+    "messages": (
+        "[TIMESTAMP] CONV_ID (TYPE) ROLE: CONTENT",
+        "timestamp, conversation_id, message_type, role, content",
+        _fmt_message_row,
+    ),
+    "adverts": (
+        "[TIMESTAMP] NODE_ID (NAME) DETAILS",
+        "timestamp, node_id, node_name, details",
+        _fmt_advert_row,
+    ),
+    "nodes": (
+        "PUBKEY (NAME) STATUS | FIRST_SEEN -> LAST_SEEN | ADVERTS",
+        "pubkey, name, is_online, first_seen, last_seen, total_adverts",
+        _fmt_node_row,
+    ),
+    "network_events": (
+        "[TIMESTAMP] TYPE: DETAILS",
+        "timestamp, event_type, details",
+        _fmt_network_event_row,
+    ),
+    "node_names": (
+        "PUBKEY -> NAME (UPDATED)",
+        "pubkey, name, timestamp",
+        _fmt_node_name_row,
+    ),
+}
+
+# Table -> (section title, legend block), built once rather than per dump
+_TABLE_HEADERS: Dict[str, Tuple[str, str]] = {
+    table: (f"\n--- {table.upper()} ---", f"\nFormat: {legend}\n{'-' * 80}")
+    for table, (legend, _, _) in _DUMP_FORMATS.items()
+}
+
+# Tables not ordered by id when dumping
+_DUMP_ORDER_BY: Dict[str, str] = {"node_names": "timestamp", "nodes": "last_seen"}
+
+
 @cli.command()
 @click.option(
     "--db-path",
@@ -469,148 +584,51 @@ def test(
 def dump(db_path: Path, table: str, limit: int) -> None:
     """Dump SQLite database contents in human-readable text format for debugging."""
     import sqlite3
-    from datetime import datetime
 
     try:
-        # Connect to database
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
+        # Connect read-only: no write lock, and never creates a missing file
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        conn.execute("PRAGMA query_only = 1")
         cursor = conn.cursor()
 
         click.echo(f"\n=== MeshBot Database Dump: {db_path} ===\n")
 
         # Determine which tables to dump
-        tables_to_dump = []
-        if table == "all":
-            tables_to_dump = [
-                "messages",
-                "adverts",
-                "nodes",
-                "network_events",
-                "node_names",
-            ]
-        else:
-            tables_to_dump = [table]
-
-        # Dump each table
+        tables_to_dump = list(_DUMP_FORMATS) if table == "all" else [table]
+
+        # Dump each table, writing each table's section in one echo
         for table_name in tables_to_dump:
-            click.echo(f"\n--- {table_name.upper()} ---")
+            title, legend = _TABLE_HEADERS[table_name]
+            lines = [title]
 
             # Get row count
-            cursor.execute(f"SELECT COUNT(*) as count FROM {table_name}")
-            total_count = cursor.fetchone()["count"]
-            click.echo(f"Total rows: {total_count}")
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            (total_count,) = cursor.fetchone()
+            lines.append(f"Total rows: {total_count}")
 
             if total_count == 0:
-                click.echo("(empty)\n")
+                lines.append("(empty)\n")
+                click.echo("\n".join(lines))
                 continue
 
             # Fetch rows (some tables use different ordering)
-            if table_name == "node_names":
-                cursor.execute(
-                    f"SELECT * FROM {table_name} ORDER BY timestamp DESC LIMIT {limit}"
-                )
-            elif table_name == "nodes":
-                cursor.execute(
-                    f"SELECT * FROM {table_name} ORDER BY last_seen DESC LIMIT {limit}"
-                )
-            else:
-                cursor.execute(
-                    f"SELECT * FROM {table_name} ORDER BY id DESC LIMIT {limit}"
-                )
-            rows = cursor.fetchall()
-
-            if table_name == "messages":
-                click.echo("\nFormat: [TIMESTAMP] CONV_ID (TYPE) ROLE: CONTENT")
-                click.echo("-" * 80)
-                for row in rows:
-                    ts = datetime.fromtimestamp(row["timestamp"]).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    conv_id = (
-                        row["conversation_id"][:16] + "..."
-                        if len(row["conversation_id"]) > 16
-                        else row["conversation_id"]
-                    )
-                    msg_type = row["message_type"][:3].upper()  # DM/CHA
-                    role = row["role"]
-                    content = (
-                        row["content"][:60] + "..."
-                        if len(row["content"]) > 60
-                        else row["content"]
-                    )
-                    click.echo(f"[{ts}] {conv_id} ({msg_type}) {role}: {content}")
-
-            elif table_name == "adverts":
-                click.echo("\nFormat: [TIMESTAMP] NODE_ID (NAME) DETAILS")
-                click.echo("-" * 80)
-                for row in rows:
-                    ts = datetime.fromtimestamp(row["timestamp"]).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    node_id = (
-                        row["node_id"][:16] + "..."
-                        if row["node_id"] and len(row["node_id"]) > 16
-                        else row["node_id"] or "unknown"
-                    )
-                    node_name = f" ({row['node_name']})" if row["node_name"] else ""
-                    details = row["details"] or ""
-                    click.echo(f"[{ts}] {node_id}{node_name} {details}")
-
-            elif table_name == "nodes":
-                click.echo(
-                    "\nFormat: PUBKEY (NAME) STATUS | FIRST_SEEN -> LAST_SEEN | ADVERTS"
-                )
-                click.echo("-" * 80)
-                for row in rows:
-                    pubkey = (
-                        row["pubkey"][:16] + "..."
-                        if len(row["pubkey"]) > 16
-                        else row["pubkey"]
-                    )
-                    name = f" ({row['name']})" if row["name"] else ""
-                    status = "🟢" if row["is_online"] else "🔴"
-                    first_seen = datetime.fromtimestamp(row["first_seen"]).strftime(
-                        "%Y-%m-%d %H:%M"
-                    )
-                    last_seen = datetime.fromtimestamp(row["last_seen"]).strftime(
-                        "%Y-%m-%d %H:%M"
-                    )
-                    total_adverts = row["total_adverts"]
-                    click.echo(
-                        f"{pubkey}{name} {status} | {first_seen} -> {last_seen} | {total_adverts} adverts"
-                    )
+            _, columns, format_row = _DUMP_FORMATS[table_name]
+            order_by = _DUMP_ORDER_BY.get(table_name, "id")
+            cursor.execute(
+                f"SELECT {columns} FROM {table_name} "
+                f"ORDER BY {order_by} DESC LIMIT ?",
+                (limit,),
+            )
 
-            elif table_name == "network_events":
-                click.echo("\nFormat: [TIMESTAMP] TYPE: DETAILS")
-                click.echo("-" * 80)
-                for row in rows:
-                    ts = datetime.fromtimestamp(row["timestamp"]).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    event_type = row["event_type"]
-                    details = row["details"] or ""
-                    click.echo(f"[{ts}] {event_type}: {details}")
-
-            elif table_name == "node_names":
-                click.echo("\nFormat: PUBKEY -> NAME (UPDATED)")
-                click.echo("-" * 80)
-                for row in rows:
-                    pubkey = (
-                        row["pubkey"][:16] + "..."
-                        if len(row["pubkey"]) > 16
-                        else row["pubkey"]
-                    )
-                    name = row["name"]
-                    ts = datetime.fromtimestamp(row["timestamp"]).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    )
-                    click.echo(f"{pubkey} -> {name} (updated: {ts})")
+            lines.append(legend)
+            # Format rows straight off the cursor rather than via fetchall()
+            lines.extend(format_row(row) for row in cursor)
 
             if total_count > limit:
-                click.echo(f"\n(Showing latest {limit} of {total_count} rows)")
+                lines.append(f"\n(Showing latest {limit} of {total_count} rows)")
 
-            click.echo()
+            lines.append("")
+            click.echo("\n".join(lines))
 
         conn.close()
         click.echo("=== End of dump ===\n")
@@ -1,6 +1,7 @@
 """Advertisement and network event storage."""
 
 import csv
+import heapq
 import logging
 import time
 from collections import deque
@@ -144,9 +145,10 @@ class AdvertStorage(NodeStorage):
                         }
                     )
 
-            # Sort by timestamp (most recent first) and limit
-            adverts.sort(key=lambda x: cast(float, x["timestamp"]), reverse=True)
-            return adverts[:limit]
+            # Most recent first, top-k only
+            return heapq.nlargest(
+                limit, adverts, key=lambda x: cast(float, x["timestamp"])
+            )
 
         except Exception as e:
             logger.error(f"Error searching adverts: {e}")
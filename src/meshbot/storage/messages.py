@@ -1,8 +1,12 @@
 """Message storage operations."""
 
+import asyncio
+import heapq
 import logging
 import time
-from typing import Any, Dict, List, Optional, cast
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from .base import BaseStorage
 
@@ -66,11 +70,12 @@ class MessageStorage(BaseStorage):
 
         Args:
             conversation_id: Conversation/user/channel ID
-            limit: Maximum number of messages to return
-            offset: Number of messages to skip
+            limit: Maximum number of messages to return (the most recent ones)
+            offset: Number of most recent messages to skip
 
         Returns:
-            List of message dicts with keys: role, content, timestamp, sender
+            List of message dicts with keys: role, content, timestamp, sender,
+            oldest first
         """
         try:
             # Use path-only version to avoid creating directory
@@ -84,38 +89,18 @@ class MessageStorage(BaseStorage):
             if not messages_file.exists():
                 return []
 
-            messages = []
-            with open(messages_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+            # Read and parse in one thread hop instead of blocking the loop,
+            # keeping only the tail of the file the window can reach
+            max_messages = None if limit is None else offset + limit
+            messages = await asyncio.to_thread(
+                self._read_messages, messages_file, max_messages
+            )
 
-                    # Parse line: timestamp|message_type|role|content|sender
-                    parts = line.split("|")
-                    if len(parts) >= 4:
-                        timestamp_str = parts[0]
-                        _ = parts[1]  # message_type (not used here, but part of format)
-                        role = parts[2]
-                        # Content might contain escaped pipes
-                        content = "|".join(parts[3:-1]) if len(parts) > 4 else parts[3]
-                        content = content.replace("\\|", "|")  # Unescape
-                        sender = parts[-1] if len(parts) > 4 else None
-
-                        messages.append(
-                            {
-                                "role": role,
-                                "content": content,
-                                "timestamp": float(timestamp_str),
-                                "sender": sender,
-                            }
-                        )
-
-            # Apply offset and limit
+            # Apply offset and limit from the newest end
             if offset > 0:
-                messages = messages[offset:]
+                messages = messages[:-offset]
             if limit is not None:
-                messages = messages[:limit]
+                messages = messages[-limit:] if limit > 0 else []
 
             return messages
 
@@ -145,6 +130,9 @@ class MessageStorage(BaseStorage):
         try:
             messages = []
 
+            # Lowercase the keyword once rather than per scanned message
+            keyword_lower = keyword.lower() if keyword else None
+
             # Determine which files to search
             if conversation_id:
                 # Use path-only version to avoid creating directory
@@ -179,47 +167,22 @@ class MessageStorage(BaseStorage):
                 # For channels: data/channels/{number}/messages.txt -> use number
                 file_conv_id = messages_file.parent.name
 
-                with open(messages_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # Parse line: timestamp|message_type|role|content|sender
-                        parts = line.split("|")
-                        if len(parts) >= 4:
-                            timestamp_str = parts[0]
-                            _ = parts[
-                                1
-                            ]  # message_type (not used here, but part of format)
-                            role = parts[2]
-                            content = (
-                                "|".join(parts[3:-1]) if len(parts) > 4 else parts[3]
-                            )
-                            content = content.replace("\\|", "|")
-                            sender = parts[-1] if len(parts) > 4 else None
-
-                            timestamp_val = float(timestamp_str)
-
-                            # Apply filters
-                            if since and timestamp_val < since:
-                                continue
-                            if keyword and keyword.lower() not in content.lower():
-                                continue
-
-                            messages.append(
-                                {
-                                    "conversation_id": file_conv_id,
-                                    "role": role,
-                                    "content": content,
-                                    "timestamp": timestamp_val,
-                                    "sender": sender,
-                                }
-                            )
-
-            # Sort by timestamp (most recent first) and limit
-            messages.sort(key=lambda x: cast(float, x["timestamp"]), reverse=True)
-            return messages[:limit]
+                file_messages = await asyncio.to_thread(
+                    self._read_messages, messages_file
+                )
+                for msg in file_messages:
+                    # Apply filters
+                    if since and msg["timestamp"] < since:
+                        continue
+                    if keyword_lower and keyword_lower not in msg["content"].lower():
+                        continue
+
+                    messages.append({"conversation_id": file_conv_id, **msg})
+
+            # Most recent first, top-k only
+            return heapq.nlargest(
+                limit, messages, key=lambda x: cast(float, x["timestamp"])
+            )
 
         except Exception as e:
             logger.error(f"Error searching messages: {e}")
@@ -297,26 +260,18 @@ class MessageStorage(BaseStorage):
 
             total_conversations = len(message_files)
 
-            total_messages = 0
-            channel_messages = 0
-            dm_messages = 0
-
-            for messages_file in message_files:
-                with open(messages_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        total_messages += 1
-                        # Parse message type
-                        parts = line.split("|")
-                        if len(parts) >= 2:
-                            message_type = parts[1]
-                            if message_type == "channel":
-                                channel_messages += 1
-                            elif message_type == "direct":
-                                dm_messages += 1
+            # Count files concurrently off the event loop (one thread hop per
+            # file; the default executor bounds how many run at once)
+            counts = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._count_messages, messages_file)
+                    for messages_file in message_files
+                )
+            )
+
+            total_messages = sum(total for total, _, _ in counts)
+            channel_messages = sum(channel for _, channel, _ in counts)
+            dm_messages = sum(direct for _, _, direct in counts)
 
             return {
                 "total_messages": total_messages,
@@ -333,3 +288,81 @@ class MessageStorage(BaseStorage):
                 "channel_messages": 0,
                 "dm_messages": 0,
             }
+
+    @staticmethod
+    def _read_messages(
+        messages_file: Path, max_messages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read and parse messages from a messages file (blocking).
+
+        Args:
+            messages_file: Path to a messages.txt file
+            max_messages: Only parse the last this many lines (all if None)
+
+        Returns:
+            List of message dicts with keys: role, content, timestamp, sender
+        """
+        messages: List[Dict[str, Any]] = []
+        with open(messages_file, "r", encoding="utf-8") as f:
+            # Use deque with maxlen for efficient last-N-lines reading
+            lines = f if max_messages is None else deque(f, maxlen=max_messages)
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+
+                # Parse line: timestamp|message_type|role|content|sender
+                parts = line.split("|")
+                if len(parts) >= 4:
+                    timestamp_str = parts[0]
+                    _ = parts[1]  # message_type (not used here, but part of format)
+                    role = parts[2]
+                    # Content might contain escaped pipes
+                    content = "|".join(parts[3:-1]) if len(parts) > 4 else parts[3]
+                    content = content.replace("\\|", "|")  # Unescape
+                    sender = parts[-1] if len(parts) > 4 else None
+
+                    messages.append(
+                        {
+                            "role": role,
+                            "content": content,
+                            "timestamp": float(timestamp_str),
+                            "sender": sender,
+                        }
+                    )
+
+        return messages
+
+    @staticmethod
+    def _count_messages(messages_file: Path) -> Tuple[int, int, int]:
+        """
+        Count messages in a single messages file (blocking).
+
+        Args:
+            messages_file: Path to a messages.txt file
+
+        Returns:
+            Tuple of (total, channel, direct) message counts
+        """
+        total = 0
+        channel = 0
+        direct = 0
+
+        with open(messages_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+
+                total += 1
+                # Parse message type
+                parts = line.split("|")
+                if len(parts) >= 2:
+                    message_type = parts[1]
+                    if message_type == "channel":
+                        channel += 1
+                    elif message_type == "direct":
+                        direct += 1
+
+        return total, channel, direct
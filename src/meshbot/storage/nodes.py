@@ -1,5 +1,6 @@
 """Node registry and name mapping storage."""
 
+import heapq
 import json
 import logging
 import time
@@ -292,10 +293,10 @@ class NodeStorage(BaseStorage):
                 except Exception:
                     continue
 
-            # Sort by last_seen (most recent first)
-            nodes.sort(key=lambda x: x.get("last_seen", 0) or 0, reverse=True)
-
-            return nodes[:limit]
+            # Most recently seen first, top-k only
+            return heapq.nlargest(
+                limit, nodes, key=lambda x: x.get("last_seen", 0) or 0
+            )
 
         except Exception as e:
             logger.error(f"Error listing nodes: {e}")
@@ -42,12 +42,12 @@ def register_node_tools(agent: Any) -> None:
             if not messages:
                 return f"No messages in channel {channel}."
 
-            response = f"Last {len(messages)} message(s) in channel {channel}:\n"
+            lines = [f"Last {len(messages)} message(s) in channel {channel}:"]
             for msg in messages:
                 role = "User" if msg["role"] == "user" else "Bot"
-                response += f"{role}: {msg['content']}\n"
+                lines.append(f"{role}: {msg['content']}")
 
-            return response.strip()
+            return "\n".join(lines).strip()
         except Exception as e:
             logger.error(f"Error getting channel messages: {e}")
             return f"Error retrieving messages from channel {channel}."
@@ -72,12 +72,12 @@ def register_node_tools(agent: Any) -> None:
             if not messages:
                 return f"No conversation history with user {user_id[:16]}..."
 
-            response = f"Last {len(messages)} message(s) with {user_id[:16]}:\n"
+            lines = [f"Last {len(messages)} message(s) with {user_id[:16]}:"]
             for msg in messages:
                 role = "User" if msg["role"] == "user" else "Bot"
-                response += f"{role}: {msg['content']}\n"
+                lines.append(f"{role}: {msg['content']}")
 
-            return response.strip()
+            return "\n".join(lines).strip()
         except Exception as e:
             logger.error(f"Error getting user messages: {e}")
             return f"Error retrieving messages with user {user_id[:16]}..."
@@ -134,7 +134,7 @@ def register_node_tools(agent: Any) -> None:
             # Format results
             from datetime import datetime
 
-            result = f"Found {len(adverts)} advertisement(s):\n"
+            lines = [f"Found {len(adverts)} advertisement(s):"]
             for advert in adverts:
                 timestamp = datetime.fromtimestamp(advert["timestamp"])
                 time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
@@ -142,9 +142,9 @@ def register_node_tools(agent: Any) -> None:
                     advert["node_id"][:16] if advert["node_id"] else "unknown"
                 )
                 name = f" ({advert['node_name']})" if advert["node_name"] else ""
-                result += f"[{time_str}] {node_display}{name}\n"
+                lines.append(f"[{time_str}] {node_display}{name}")
 
-            return result.strip()
+            return "\n".join(lines).strip()
 
         except Exception as e:
             logger.error(f"Error searching adverts: {e}")
@@ -240,7 +240,7 @@ def register_node_tools(agent: Any) -> None:
             # Format results
             from datetime import datetime
 
-            result = f"Found {len(nodes)} node(s):\n"
+            lines = [f"Found {len(nodes)} node(s):"]
             for node in nodes:
                 status = "🟢" if node["is_online"] else "🔴"
                 node_id = node["pubkey"][:16]
@@ -252,9 +252,11 @@ def register_node_tools(agent: Any) -> None:
                     if node["total_adverts"] > 0
                     else ""
                 )
-                result += f"{status} {node_id}{name} - last seen {time_str}{adverts}\n"
+                lines.append(
+                    f"{status} {node_id}{name} - last seen {time_str}{adverts}"
+                )
 
-            return result.strip()
+            return "\n".join(lines).strip()
 
         except Exception as e:
             logger.error(f"Error listing nodes: {e}")
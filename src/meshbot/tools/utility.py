@@ -1,6 +1,7 @@
 """Utility tools for general purpose tasks."""
 
 import logging
+import re
 from typing import Any
 
 from pydantic_ai import RunContext
@@ -9,6 +10,9 @@ from .logging_wrapper import create_logging_tool_decorator
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed in calculator expressions (numbers, operators, math functions)
+_SAFE_EXPRESSION_RE = re.compile(r"^[0-9+\-*/()., a-z]+$")
+
 
 def register_utility_tools(agent: Any) -> None:
     """Register utility tools.
@@ -31,10 +35,9 @@ def register_utility_tools(agent: Any) -> None:
         """
         try:
             import math
-            import re
 
             # Allow only safe characters (numbers, operators, math functions)
-            if not re.match(r"^[0-9+\-*/()., a-z]+$", expression.lower()):
+            if not _SAFE_EXPRESSION_RE.match(expression.lower()):
                 return "Invalid expression. Use only numbers and basic math operators."
 
             # Create safe namespace with math functions
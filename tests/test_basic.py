@@ -2,9 +2,13 @@
 
 import asyncio
 from pathlib import Path
+from typing import Any, AsyncIterator, List, Tuple
 
 import pytest
+from pydantic_ai.exceptions import ModelHTTPError, UsageLimitExceeded
 
+from meshbot import main
+from meshbot.agent import MeshBotAgent
 from meshbot.memory import MemoryManager
 from meshbot.meshcore_interface import MeshCoreMessage, MockMeshCoreInterface
 
@@ -80,6 +84,40 @@ class TestMemoryManager:
         assert history[0]["content"] == "Message 0"
         assert history[-1]["content"] == "Message 4"
 
+    @pytest.mark.asyncio
+    async def test_conversation_window_is_most_recent(
+        self, memory_manager: MemoryManager
+    ) -> None:
+        """Test that limit/offset select the newest messages, oldest first."""
+        user_id = "test_window_user"
+
+        for i in range(10):
+            await memory_manager.add_message(
+                user_id=user_id,
+                role="user",
+                content=f"Message {i}",
+                message_type="direct",
+                timestamp=1234567890.0 + i,
+            )
+
+        storage = memory_manager.storage
+        latest = await storage.get_conversation_messages(user_id, limit=3)
+        assert [m["content"] for m in latest] == [
+            "Message 7",
+            "Message 8",
+            "Message 9",
+        ]
+
+        earlier = await storage.get_conversation_messages(user_id, limit=3, offset=2)
+        assert [m["content"] for m in earlier] == [
+            "Message 5",
+            "Message 6",
+            "Message 7",
+        ]
+
+        history = await memory_manager.get_conversation_history(user_id, limit=2)
+        assert [m["content"] for m in history] == ["Message 8", "Message 9"]
+
     @pytest.mark.asyncio
     async def test_conversation_context(self, memory_manager: MemoryManager) -> None:
         """Test getting conversation context for LLM."""
@@ -184,6 +222,240 @@ class TestMockMeshCore:
         await mock.disconnect()
 
 
+class TestMessageSplitting:
+    """Test splitting long responses into MeshCore-sized chunks."""
+
+    def test_short_message_not_split(self) -> None:
+        """Test that a message within the limit is returned unchanged."""
+        agent = MeshBotAgent(max_message_length=120)
+
+        assert agent._split_message("Hello  there") == ["Hello there"]
+
+    def test_long_message_split_with_indicators(self) -> None:
+        """Test that long messages are split on word boundaries."""
+        agent = MeshBotAgent(max_message_length=40)
+        message = " ".join(f"word{i}" for i in range(30))
+
+        chunks = agent._split_message(message)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 40 for chunk in chunks)
+        assert chunks[0].endswith(f"(1/{len(chunks)})")
+        assert chunks[-1].endswith(f"({len(chunks)}/{len(chunks)})")
+        rejoined = " ".join(chunk.rsplit(" (", 1)[0] for chunk in chunks)
+        assert rejoined == message
+
+    def test_paragraph_breaks_collapse_when_split(self) -> None:
+        """Test that blank-line paragraph breaks become single spaces in chunks."""
+        agent = MeshBotAgent(max_message_length=60)
+        message = (
+            "Hi there.\n\nIt is sunny today.\n\n"
+            "Wind from the west at 10 km/h, gusting later on."
+        )
+
+        chunks = agent._split_message(message)
+
+        assert chunks[0] == "Hi there. It is sunny today. Wind from the west at (1/2)"
+        assert all("  " not in chunk for chunk in chunks)
+
+    def test_overlong_word_is_broken(self) -> None:
+        """Test that a single word longer than a chunk is broken up."""
+        agent = MeshBotAgent(max_message_length=40)
+
+        chunks = agent._split_message("x" * 100)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 40 for chunk in chunks)
+
+    def test_tiny_max_length_does_not_raise(self) -> None:
+        """Test that a limit no bigger than the suffix still splits."""
+        agent = MeshBotAgent(max_message_length=8)
+
+        chunks = agent._split_message("hello world")
+
+        assert len(chunks) > 1
+        assert chunks[0].startswith("h (1/")
+
+
+class RecordingMeshCore(MockMeshCoreInterface):
+    """Mock interface that records sends and disconnects in order."""
+
+    def __init__(self):
+        super().__init__()
+        self.events: List[Tuple[str, ...]] = []
+
+    async def send_message(self, destination: str, message: str) -> bool:
+        sent = await super().send_message(destination, message)
+        self.events.append(("send", destination, message))
+        return sent
+
+    async def disconnect(self) -> None:
+        self.events.append(("disconnect",))
+        await super().disconnect()
+
+
+class FailingAgent:
+    """Stand-in for the pydantic-ai agent whose runs always fail."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+    async def run(self, *args: Any, **kwargs: Any) -> Any:
+        raise self.error
+
+
+class TestErrorNotices:
+    """Test background error notices sent when the LLM run fails."""
+
+    @pytest.fixture
+    async def agent(self, tmp_path: Path) -> AsyncIterator[MeshBotAgent]:
+        """Create an agent wired to a recording mock interface."""
+        agent = MeshBotAgent(data_dir=tmp_path)
+        meshcore = RecordingMeshCore()
+        await meshcore.connect()
+        agent._meshcore = meshcore
+        agent._memory = MemoryManager(storage_path=tmp_path, max_lines=1000)
+        await agent._memory.load()
+        yield agent
+        await meshcore.disconnect()
+
+    @staticmethod
+    def _message() -> MeshCoreMessage:
+        return MeshCoreMessage(
+            sender="node1",
+            sender_name="TestNode1",
+            content="hello",
+            timestamp=asyncio.get_event_loop().time(),
+            message_type="direct",
+        )
+
+    @pytest.mark.asyncio
+    async def test_usage_limit_is_handled(self, agent: MeshBotAgent) -> None:
+        """Test that a usage limit counts as handled and explains itself."""
+        agent._agent = FailingAgent(UsageLimitExceeded("request_limit of 20"))
+
+        assert await agent._handle_message(self._message()) is True
+        assert len(agent._background_tasks) == 1
+
+        await agent.drain()
+        assert not agent._background_tasks
+        (event,) = agent.meshcore.events
+        assert event[:2] == ("send", "node1")
+        assert "too complex" in event[2]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [ModelHTTPError(status_code=401, model_name="test"), RuntimeError("boom")],
+    )
+    async def test_failure_sends_apology(
+        self, agent: MeshBotAgent, error: Exception
+    ) -> None:
+        """Test that other failures report False and apologise once drained."""
+        agent._agent = FailingAgent(error)
+
+        assert await agent._handle_message(self._message()) is False
+
+        await agent.drain()
+        assert not agent._background_tasks
+        (event,) = agent.meshcore.events
+        assert event[:2] == ("send", "node1")
+        assert "encountered an error" in event[2]
+
+    @pytest.mark.asyncio
+    async def test_raise_errors_sends_nothing(self, agent: MeshBotAgent) -> None:
+        """Test that raise_errors re-raises without notifying the sender."""
+        agent._agent = FailingAgent(RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await agent._handle_message(self._message(), raise_errors=True)
+
+        await agent.drain()
+        assert agent.meshcore.events == []
+
+    @pytest.mark.asyncio
+    async def test_failed_notice_is_logged(
+        self, agent: MeshBotAgent, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a notice that cannot be sent is logged, not raised."""
+
+        async def broken_send(destination: str, message: str) -> bool:
+            raise ConnectionError("radio gone")
+
+        agent.meshcore.send_message = broken_send  # type: ignore[method-assign]
+
+        agent._notify_in_background("node1", "notice")
+        await agent.drain()
+
+        assert not agent._background_tasks
+        assert "Could not send notice to node1" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_before_disconnect(self, agent: MeshBotAgent) -> None:
+        """Test that stop() lets pending notices go out before disconnecting."""
+        agent._running = True
+        agent._notify_in_background("node1", "notice")
+
+        await agent.stop()
+
+        assert not agent._background_tasks
+        assert agent.meshcore.events == [
+            ("send", "node1", "notice"),
+            ("disconnect",),
+        ]
+
+
+class TestCliOverrides:
+    """Test how command line options layer over environment configuration."""
+
+    @pytest.fixture(autouse=True)
+    def environment(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Set environment configuration and leave logging untouched."""
+        monkeypatch.setattr(main, "setup_logging", lambda *args: None)
+        monkeypatch.setenv("LLM_API_KEY", "test-key")
+        monkeypatch.setenv("DATA_DIR", str(tmp_path))
+        monkeypatch.setenv("MESHCORE_DEBUG", "true")
+        monkeypatch.setenv("MESHCORE_AUTO_RECONNECT", "true")
+
+    def test_unset_options_keep_environment(self) -> None:
+        """Test that options left at their defaults don't override the env."""
+        app_config = main._prepare(
+            0, {"meshcore_debug": False, "meshcore_auto_reconnect": None}
+        )
+        assert app_config.meshcore.debug is True
+        assert app_config.meshcore.auto_reconnect is True
+
+    def test_explicit_options_override_environment(self) -> None:
+        """Test that given options, including an explicit False, win."""
+        app_config = main._prepare(
+            1,
+            {
+                "model": "openai:gpt-4o",
+                "meshcore_timeout": 5,
+                "meshcore_auto_reconnect": False,
+            },
+        )
+        assert app_config.ai.model == "openai:gpt-4o"
+        assert app_config.meshcore.timeout == 5
+        assert app_config.meshcore.auto_reconnect is False
+        assert app_config.logging.level == "DEBUG"
+
+    def test_missing_api_key_exits_before_validation(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that require_api_key stops before load_config() can fail."""
+        monkeypatch.delenv("LLM_API_KEY")
+
+        def fail() -> None:
+            raise AssertionError("load_config() should not run")
+
+        monkeypatch.setattr(main, "load_config", fail)
+
+        with pytest.raises(SystemExit) as exc_info:
+            main._prepare(0, {}, require_api_key=True)
+        assert exc_info.value.code == 1
+
+
 class TestIntegration:
     """Integration tests."""
 